@@ -13,6 +13,7 @@ import async_timeout
 from yarl import URL
 
 from homeassistant.auth import jwt_wrapper
+from homeassistant.util.json import json_loads
 
 TIMEOUT = 10
 
@@ -321,7 +322,7 @@ class FrigateApiClient:
                     if is_login_request:
                         return response
                     if decode_json:
-                        return await response.json()
+                        return await response.json(loads=json_loads)
                     return await response.text()
 
         except asyncio.TimeoutError as exc:
@@ -34,10 +34,8 @@ async def async_setup_entry(
     frigate_config = hass.data[DOMAIN][entry.entry_id][ATTR_CONFIG]
 
     async_add_entities(
-        [
-            FrigateMqttSnapshots(hass, entry, frigate_config, cam_name, obj_name)
-            for cam_name, obj_name in get_cameras_and_objects(frigate_config, False)
-        ]
+        FrigateMqttSnapshots(hass, entry, frigate_config, cam_name, obj_name)
+        for cam_name, obj_name in get_cameras_and_objects(frigate_config, False)
     )
 
 
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+from collections.abc import Sequence
 import datetime as dt
 import enum
+import functools
+import itertools
 import logging
-from typing import Any, cast
+import random
+import time
+from typing import Any, Self, cast
 
 import attr
 from dateutil.relativedelta import relativedelta
@@ -19,7 +26,7 @@ from homeassistant.components.media_source.models import (
     PlayMedia,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import system_info
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import DATE_STR_FORMAT
 from homeassistant.util.dt import DEFAULT_TIME_ZONE, async_get_time_zone
 
@@ -39,6 +46,42 @@ ITEM_LIMIT = 50
 SECONDS_IN_DAY = 60 * 60 * 24
 SECONDS_IN_MONTH = SECONDS_IN_DAY * 31
 
+# Keyword arguments shared by all the directories in the browser.
+BASE_DIRECTORY_KWARGS: dict[str, Any] = {
+    "domain": DOMAIN,
+    "media_class": MediaClass.DIRECTORY,
+    "can_play": False,
+    "can_expand": True,
+    "thumbnail": None,
+}
+
+# Keyword arguments shared by all the drilldown directories in the browser,
+# which themselves only contain directories.
+DIRECTORY_SOURCE_KWARGS: dict[str, Any] = {
+    **BASE_DIRECTORY_KWARGS,
+    "children_media_class": MediaClass.DIRECTORY,
+}
+
+# How long (in seconds) an event summary is served before being refreshed. The
+# jitter spreads out refreshes across instances and media types.
+SUMMARY_CACHE_TTL = 60
+SUMMARY_CACHE_TTL_JITTER = 10
+
+# Above this many events, the browse items for them are built in the executor.
+EVENT_RESPONSE_EXECUTOR_THRESHOLD = 500
+
+# How long (in seconds) the events for a given search are reused, and for how
+# many searches at most.
+EVENTS_CACHE_TTL = 10
+EVENTS_CACHE_MAX_ENTRIES = 64
+
+# Event summaries are stored so that the first browse after a restart does not
+# need to wait on Frigate. Writes are delayed (in seconds) so that summaries
+# fetched around the same time are written together.
+STORAGE_KEY = f"{DOMAIN}.event_summaries"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 
 async def async_get_media_source(hass: HomeAssistant) -> MediaSource:
     """Set up Frigate media source."""
@@ -48,6 +91,8 @@ async def async_get_media_source(hass: HomeAssistant) -> MediaSource:
 class FrigateBrowseMediaMetadata:
     """Metadata for browsable Frigate media files."""
 
+    __slots__ = ("event",)
+
     event: dict[str, Any] | None
 
     def __init__(self, event: dict[str, Any]):
@@ -79,7 +124,7 @@ class FrigateBrowseMediaSource(BrowseMediaSource):
         self.frigate = frigate
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class Identifier:
     """Base class for Identifiers."""
 
@@ -87,12 +132,25 @@ class Identifier:
         validator=[attr.validators.instance_of(str)],
     )
 
+    # The string form is built on first use and then reused, as identifiers
+    # are immutable.
+    _str: str | None = attr.ib(init=False, default=None, eq=False, repr=False)
+
+    def __str__(self) -> str:
+        """Convert to a string."""
+        if self._str is None:
+            object.__setattr__(self, "_str", self._to_str())
+        return cast(str, self._str)
+
+    def _to_str(self) -> str:
+        """Build the string form of this identifier."""
+        raise NotImplementedError
+
     @classmethod
     def _get_index(cls, data: list, index: int, default: Any = None) -> Any:
-        try:
-            return data[index] if data[index] != "" else default
-        except IndexError:
-            return default
+        if index < len(data) and data[index] != "":
+            return data[index]
+        return default
 
     @classmethod
     def _empty_if_none(cls, data: Any) -> str:
@@ -104,13 +162,13 @@ class Identifier:
         cls,
         data: str,
         default_frigate_instance_id: str | None = None,
-    ) -> EventSearchIdentifier | EventIdentifier | RecordingIdentifier | None:
-        """Generate a EventSearchIdentifier from a string."""
-        return (
-            EventSearchIdentifier.from_str(data, default_frigate_instance_id)
-            or EventIdentifier.from_str(data, default_frigate_instance_id)
-            or RecordingIdentifier.from_str(data, default_frigate_instance_id)
-        )
+    ) -> Self | None:
+        """Generate an identifier of the matching type from a string.
+
+        Called on a subclass, None is returned for other identifier types.
+        """
+        identifier = _parse_identifier(data, default_frigate_instance_id)
+        return identifier if isinstance(identifier, cls) else None
 
     @classmethod
     def get_identifier_type(cls) -> str:
@@ -121,18 +179,6 @@ class Identifier:
         """Get the proxy (Home Assistant view) path for this identifier."""
         raise NotImplementedError
 
-    @classmethod
-    def _add_frigate_instance_id_to_parts_if_absent(
-        cls, parts: list[str], default_frigate_instance_id: str | None = None
-    ) -> list[str]:
-        """Add a frigate instance id if it's not specified."""
-        if (
-            cls._get_index(parts, 0) == cls.get_identifier_type()
-            and default_frigate_instance_id is not None
-        ):
-            parts.insert(0, default_frigate_instance_id)
-        return parts
-
     @property
     def mime_type(self) -> str:
         """Get mime type for this identifier."""
@@ -184,7 +230,7 @@ class FrigateMediaType(enum.Enum):
         return "jpg"
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class EventIdentifier(Identifier):
     """Event Identifier (clip or snapshot)."""
 
@@ -200,28 +246,31 @@ class EventIdentifier(Identifier):
         validator=[attr.validators.instance_of(str)],
     )
 
-    def __str__(self) -> str:
-        """Convert to a string."""
+    def _to_str(self) -> str:
+        """Build the string form of this identifier."""
+        return (
+            self.get_prefix(self.frigate_instance_id, self.frigate_media_type)
+            + f"{self.camera}/{self.id}"
+        )
+
+    @classmethod
+    def get_prefix(
+        cls, frigate_instance_id: str, frigate_media_type: FrigateMediaType
+    ) -> str:
+        """Get the string form shared by all events of a media type."""
         return "/".join(
             (
-                self.frigate_instance_id,
-                self.get_identifier_type(),
-                self.frigate_media_type.value,
-                self.camera,
-                self.id,
+                frigate_instance_id,
+                cls.get_identifier_type(),
+                frigate_media_type.value,
+                "",
             )
         )
 
     @classmethod
-    def from_str(
-        cls, data: str, default_frigate_instance_id: str | None = None
-    ) -> EventIdentifier | None:
-        """Generate a EventIdentifier from a string."""
-        parts = cls._add_frigate_instance_id_to_parts_if_absent(
-            data.split("/"), default_frigate_instance_id
-        )
-
-        if len(parts) != 5 or parts[1] != cls.get_identifier_type():
+    def _from_parts(cls, parts: list[str]) -> EventIdentifier | None:
+        """Generate a EventIdentifier from the parts of a string."""
+        if len(parts) != 5:
             return None
 
         try:
@@ -251,12 +300,69 @@ class EventIdentifier(Identifier):
         return self.frigate_media_type.mime_type
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_identifier(
+    data: str, default_frigate_instance_id: str | None
+) -> EventSearchIdentifier | EventIdentifier | RecordingIdentifier | None:
+    """Parse an identifier string into an identifier of the matching type.
+
+    Identifiers are immutable, so the same instance is safely returned for
+    repeated parses of the same string.
+    """
+    parts = data.split("/")
+    identifier_types: dict[
+        str,
+        type[EventSearchIdentifier] | type[EventIdentifier] | type[RecordingIdentifier],
+    ] = {
+        EventSearchIdentifier.get_identifier_type(): EventSearchIdentifier,
+        EventIdentifier.get_identifier_type(): EventIdentifier,
+        RecordingIdentifier.get_identifier_type(): RecordingIdentifier,
+    }
+
+    if default_frigate_instance_id is not None and parts[0] in identifier_types:
+        identifier_cls = identifier_types[parts[0]]
+        parts.insert(0, default_frigate_instance_id)
+    elif (identifier_type := Identifier._get_index(parts, 1)) in identifier_types:
+        identifier_cls = identifier_types[identifier_type]
+    else:
+        return None
+
+    return identifier_cls._from_parts(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_title_from_name(name: str) -> str:
+    """Get the breadcrumb title (e.g. "This Month > Front Door") for a name."""
+    return " > ".join(
+        [s for s in get_friendly_name(name).split(".") if s != ""]
+    ).title()
+
+
+def _get_directory_source(
+    identifier: str, media_content_type: str, title: str, **kwargs: Any
+) -> BrowseMediaSource:
+    """Build a drilldown directory that itself only contains directories."""
+    return BrowseMediaSource(
+        **DIRECTORY_SOURCE_KWARGS,
+        identifier=identifier,
+        media_content_type=media_content_type,
+        title=title,
+        **kwargs,
+    )
+
+
 def _to_int_or_none(data: str | int) -> int | None:
     """Convert to an integer or None."""
     return int(data) if data is not None else None
 
 
-@attr.s(frozen=True)
+# Shared validators for the optional identifier attributes. None is accepted
+# without a type check.
+_OPTIONAL_STR_VALIDATOR = attr.validators.optional(attr.validators.instance_of(str))
+_OPTIONAL_INT_VALIDATOR = attr.validators.optional(attr.validators.instance_of(int))
+
+
+@attr.s(frozen=True, slots=True)
 class EventSearchIdentifier(Identifier):
     """Event Search Identifier."""
 
@@ -270,33 +376,21 @@ class EventSearchIdentifier(Identifier):
     after: int | None = attr.ib(
         default=None,
         converter=_to_int_or_none,
-        validator=[attr.validators.instance_of((int, type(None)))],
+        validator=_OPTIONAL_INT_VALIDATOR,
     )
     before: int | None = attr.ib(
         default=None,
         converter=_to_int_or_none,
-        validator=[attr.validators.instance_of((int, type(None)))],
-    )
-    camera: str | None = attr.ib(
-        default=None, validator=[attr.validators.instance_of((str, type(None)))]
-    )
-    label: str | None = attr.ib(
-        default=None, validator=[attr.validators.instance_of((str, type(None)))]
-    )
-    zone: str | None = attr.ib(
-        default=None, validator=[attr.validators.instance_of((str, type(None)))]
+        validator=_OPTIONAL_INT_VALIDATOR,
     )
+    camera: str | None = attr.ib(default=None, validator=_OPTIONAL_STR_VALIDATOR)
+    label: str | None = attr.ib(default=None, validator=_OPTIONAL_STR_VALIDATOR)
+    zone: str | None = attr.ib(default=None, validator=_OPTIONAL_STR_VALIDATOR)
 
     @classmethod
-    def from_str(
-        cls, data: str, default_frigate_instance_id: str | None = None
-    ) -> EventSearchIdentifier | None:
-        """Generate a EventSearchIdentifier from a string."""
-        parts = cls._add_frigate_instance_id_to_parts_if_absent(
-            data.split("/"), default_frigate_instance_id
-        )
-
-        if len(parts) < 3 or parts[1] != cls.get_identifier_type():
+    def _from_parts(cls, parts: list[str]) -> EventSearchIdentifier | None:
+        """Generate a EventSearchIdentifier from the parts of a string."""
+        if len(parts) < 3:
             return None
 
         try:
@@ -313,23 +407,38 @@ class EventSearchIdentifier(Identifier):
         except ValueError:
             return None
 
-    def __str__(self) -> str:
-        """Convert to a string."""
-
+    def _to_str(self) -> str:
+        """Build the string form of this identifier."""
+        return self.evolved_str()
+
+    def evolved_str(self, **changes: Any) -> str:
+        """Get the string form of this identifier with the given changes.
+
+        This is the same as str(attr.evolve(self, **changes)), without building
+        (and validating) a new identifier that would only be converted to a
+        string.
+        """
+        values = {
+            "name": self.name,
+            "after": self.after,
+            "before": self.before,
+            "camera": self.camera,
+            "label": self.label,
+            "zone": self.zone,
+            **changes,
+        }
         return "/".join(
-            [self.frigate_instance_id, self.get_identifier_type()]
-            + [
-                self._empty_if_none(val)
-                for val in (
-                    self.frigate_media_type.value,
-                    self.name,
-                    self.after,
-                    self.before,
-                    self.camera,
-                    self.label,
-                    self.zone,
-                )
-            ]
+            (
+                self.frigate_instance_id,
+                self.get_identifier_type(),
+                self.frigate_media_type.value,
+                values["name"],
+                self._empty_if_none(values["after"]),
+                self._empty_if_none(values["before"]),
+                self._empty_if_none(values["camera"]),
+                self._empty_if_none(values["label"]),
+                self._empty_if_none(values["zone"]),
+            )
         )
 
     def is_root(self) -> bool:
@@ -338,6 +447,10 @@ class EventSearchIdentifier(Identifier):
             [self.name, self.after, self.before, self.camera, self.label, self.zone]
         )
 
+    def is_all(self) -> bool:
+        """Determine if an identifier is for all events (not just a page)."""
+        return self.name.endswith(".all")
+
     @classmethod
     def get_identifier_type(cls) -> str:
         """Get the identifier type."""
@@ -359,8 +472,19 @@ def _validate_year_month_day(
 ) -> None:
     """Validate input."""
     if data:
+        # Splitting is much cheaper than strptime, and this runs for every
+        # day in a camera's recordings.
+        parts = data.split("-")
         try:
-            dt.datetime.strptime(data, "%Y-%m-%d")
+            if (
+                len(parts) != 3
+                or len(parts[0]) != 4
+                or not 1 <= len(parts[1]) <= 2
+                or not 1 <= len(parts[2]) <= 2
+                or not all(part.isdecimal() for part in parts)
+            ):
+                raise ValueError
+            dt.date(int(parts[0]), int(parts[1]), int(parts[2]))
         except ValueError as exc:
             raise ValueError(f"Invalid date in identifier: {data}") from exc
 
@@ -373,18 +497,16 @@ def _validate_hour(
         raise ValueError(f"Invalid hour in identifier: {value}")
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class RecordingIdentifier(Identifier):
     """Recording Identifier."""
 
-    camera: str | None = attr.ib(
-        default=None, validator=[attr.validators.instance_of((str, type(None)))]
-    )
+    camera: str | None = attr.ib(default=None, validator=_OPTIONAL_STR_VALIDATOR)
 
     year_month_day: str | None = attr.ib(
         default=None,
         validator=[
-            attr.validators.instance_of((str, type(None))),
+            _OPTIONAL_STR_VALIDATOR,
             _validate_year_month_day,
         ],
     )
@@ -393,23 +515,14 @@ class RecordingIdentifier(Identifier):
         default=None,
         converter=_to_int_or_none,
         validator=[
-            attr.validators.instance_of((int, type(None))),
+            _OPTIONAL_INT_VALIDATOR,
             _validate_hour,
         ],
     )
 
     @classmethod
-    def from_str(
-        cls, data: str, default_frigate_instance_id: str | None = None
-    ) -> RecordingIdentifier | None:
-        """Generate a RecordingIdentifier from a string."""
-        parts = cls._add_frigate_instance_id_to_parts_if_absent(
-            data.split("/"), default_frigate_instance_id
-        )
-
-        if len(parts) < 2 or parts[1] != cls.get_identifier_type():
-            return None
-
+    def _from_parts(cls, parts: list[str]) -> RecordingIdentifier | None:
+        """Generate a RecordingIdentifier from the parts of a string."""
         try:
             return cls(
                 frigate_instance_id=parts[0],
@@ -420,22 +533,16 @@ class RecordingIdentifier(Identifier):
         except ValueError:
             return None
 
-    def __str__(self) -> str:
-        """Convert to a string."""
+    def _to_str(self) -> str:
+        """Build the string form of this identifier."""
         return "/".join(
-            [self.frigate_instance_id, self.get_identifier_type()]
-            + [
-                self._empty_if_none(val)
-                for val in (
-                    self.camera,
-                    (
-                        f"{self.year_month_day}"
-                        if self.year_month_day is not None
-                        else None
-                    ),
-                    f"{self.hour:02}" if self.hour is not None else None,
-                )
-            ]
+            (
+                self.frigate_instance_id,
+                self.get_identifier_type(),
+                self._empty_if_none(self.camera),
+                self._empty_if_none(self.year_month_day),
+                f"{self.hour:02}" if self.hour is not None else "",
+            )
         )
 
     @classmethod
@@ -494,7 +601,7 @@ class RecordingIdentifier(Identifier):
         return str(MediaType.VIDEO)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class EventSummaryData:
     """Summary data from Frigate events."""
 
@@ -503,14 +610,126 @@ class EventSummaryData:
     labels: list[str] = attr.ib()
     zones: list[str] = attr.ib()
 
+    # For each (camera, label, zone) filter combination (None matching
+    # anything): the sorted day timestamps that have events, and the running
+    # event count total up to (but excluding) each of those days.
+    index: dict[
+        tuple[str | None, str | None, str | None], tuple[list[int], list[int]]
+    ] = attr.ib(factory=dict)
+
     @classmethod
     def from_raw_data(cls, summary_data: list[dict[str, Any]]) -> EventSummaryData:
-        """Generate an EventSummaryData object from raw data."""
+        """Generate an EventSummaryData object from raw data.
 
-        cameras = list({d["camera"] for d in summary_data})
-        labels = list({d["label"] for d in summary_data})
-        zones = list({zone for d in summary_data for zone in d["zones"]})
-        return cls(summary_data, cameras, labels, zones)
+        The raw data is left unchanged, with the cameras, labels, zones and
+        count index all gathered in the same pass over it.
+        """
+
+        cameras: set[str] = set()
+        labels: set[str] = set()
+        zones: set[str] = set()
+        day_timestamps: dict[str, int] = {}
+        day_counts: dict[tuple[str | None, str | None, str | None], dict[int, int]] = {}
+
+        for data in summary_data:
+            # Rows for the same day (one per camera, label and zone
+            # combination) share the same timestamp.
+            if (timestamp := day_timestamps.get(data["day"])) is None:
+                year, month, day = data["day"].split("-")
+                timestamp = day_timestamps[data["day"]] = int(
+                    dt.datetime(
+                        int(year), int(month), int(day), tzinfo=DEFAULT_TIME_ZONE
+                    ).timestamp()
+                )
+
+            cameras.add(data["camera"])
+            labels.add(data["label"])
+            zones.update(data["zones"])
+
+            for camera in (None, data["camera"]):
+                for label in (None, data["label"]):
+                    for zone in (None, *set(data["zones"])):
+                        counts = day_counts.setdefault((camera, label, zone), {})
+                        counts[timestamp] = counts.get(timestamp, 0) + data["count"]
+
+        index = {}
+        for key, counts in day_counts.items():
+            timestamps = sorted(counts)
+            index[key] = (
+                timestamps,
+                list(
+                    itertools.accumulate((counts[ts] for ts in timestamps), initial=0)
+                ),
+            )
+        return cls(summary_data, list(cameras), list(labels), list(zones), index)
+
+    def count(
+        self,
+        after: int | None = None,
+        before: int | None = None,
+        camera: str | None = None,
+        label: str | None = None,
+        zone: str | None = None,
+    ) -> int:
+        """Return the count of events that match the given filters."""
+        if (entry := self.index.get((camera, label, zone))) is None:
+            return 0
+
+        timestamps, totals = entry
+        start = bisect.bisect_left(timestamps, after) if after is not None else 0
+        end = (
+            bisect.bisect_left(timestamps, before)
+            if before is not None
+            else len(timestamps)
+        )
+        return totals[end] - totals[start] if end > start else 0
+
+    def count_before(
+        self,
+        timestamps: Sequence[int | None],
+        camera: str | None = None,
+        label: str | None = None,
+        zone: str | None = None,
+    ) -> list[int]:
+        """Return the count of matching events before each of the timestamps.
+
+        A timestamp of None counts all the matching events.
+        """
+        if (entry := self.index.get((camera, label, zone))) is None:
+            return [0] * len(timestamps)
+
+        day_timestamps, totals = entry
+        return [
+            totals[
+                (
+                    bisect.bisect_left(day_timestamps, timestamp)
+                    if timestamp is not None
+                    else len(day_timestamps)
+                )
+            ]
+            for timestamp in timestamps
+        ]
+
+    def count_by_day(
+        self,
+        after: int,
+        before: int,
+        camera: str | None = None,
+        label: str | None = None,
+        zone: str | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return the day timestamp and count for each day with matching events."""
+        if (entry := self.index.get((camera, label, zone))) is None:
+            return []
+
+        timestamps, totals = entry
+        return [
+            (timestamps[i], totals[i + 1] - totals[i])
+            for i in range(
+                bisect.bisect_left(timestamps, after),
+                bisect.bisect_left(timestamps, before),
+            )
+        ]
 
 
 class FrigateMediaSource(MediaSource):
@@ -522,6 +741,24 @@ class FrigateMediaSource(MediaSource):
         """Initialize Frigate source."""
         super().__init__(DOMAIN)
         self.hass = hass
+        self._day_boundaries: (
+            tuple[tuple[dt.date, dt.tzinfo | None], tuple[int, int, int, int, int]]
+            | None
+        ) = None
+        self._event_summaries: dict[
+            tuple[str, FrigateMediaType], tuple[float, EventSummaryData]
+        ] = {}
+        self._event_summary_refreshes: dict[
+            tuple[str, FrigateMediaType], asyncio.Task[None]
+        ] = {}
+        self._event_summary_locks: dict[tuple[str, FrigateMediaType], asyncio.Lock] = {}
+        self._events_cache: dict[
+            tuple[Any, ...], tuple[float, list[dict[str, Any]]]
+        ] = {}
+        self._store: Store[dict[str, list[dict[str, Any]]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._stored_event_summaries: dict[str, list[dict[str, Any]]] | None = None
 
     def _is_allowed_as_media_source(self, instance_id: str) -> bool:
         """Whether a given frigate instance is allowed as a media source."""
@@ -563,8 +800,7 @@ class FrigateMediaSource(MediaSource):
         if identifier and self._is_allowed_as_media_source(
             identifier.frigate_instance_id
         ):
-            info = await system_info.async_get_system_info(self.hass)
-            tz_name = info.get("timezone", "utc")
+            tz_name = self.hass.config.time_zone
             tz_info = await async_get_time_zone(tz_name)
             if not tz_info:
                 raise Unresolvable(
@@ -586,15 +822,11 @@ class FrigateMediaSource(MediaSource):
 
         if not item.identifier:
             base = BrowseMediaSource(
-                domain=DOMAIN,
+                **BASE_DIRECTORY_KWARGS,
                 identifier="",
-                media_class=MediaClass.DIRECTORY,
                 children_media_class=MediaClass.VIDEO,
                 media_content_type=MediaType.VIDEO,
                 title=NAME,
-                can_play=False,
-                can_expand=True,
-                thumbnail=None,
                 children=[],
             )
             base.children = []
@@ -605,54 +837,32 @@ class FrigateMediaSource(MediaSource):
                 if frigate_instance_id and self._is_allowed_as_media_source(
                     frigate_instance_id
                 ):
-                    clips_identifier = EventSearchIdentifier(
-                        frigate_instance_id, FrigateMediaType.CLIPS
-                    )
-                    recording_identifier = RecordingIdentifier(frigate_instance_id)
-                    snapshots_identifier = EventSearchIdentifier(
-                        frigate_instance_id, FrigateMediaType.SNAPSHOTS
-                    )
                     # Use the media class of the children to help distinguish
                     # the icons in the frontend.
                     base.children.extend(
-                        [
-                            BrowseMediaSource(
-                                domain=DOMAIN,
-                                identifier=str(clips_identifier),
-                                media_class=MediaClass.DIRECTORY,
-                                children_media_class=clips_identifier.media_class,
-                                media_content_type=clips_identifier.media_type,
-                                title=f"Clips [{config_entry.title}]",
-                                can_play=False,
-                                can_expand=True,
-                                thumbnail=None,
-                                children=[],
-                            ),
-                            BrowseMediaSource(
-                                domain=DOMAIN,
-                                identifier=str(recording_identifier),
-                                media_class=MediaClass.DIRECTORY,
-                                children_media_class=recording_identifier.media_class,
-                                media_content_type=recording_identifier.media_type,
-                                title=f"Recordings [{config_entry.title}]",
-                                can_play=False,
-                                can_expand=True,
-                                thumbnail=None,
-                                children=[],
+                        BrowseMediaSource(
+                            **BASE_DIRECTORY_KWARGS,
+                            identifier=str(root_identifier),
+                            children_media_class=root_identifier.media_class,
+                            media_content_type=root_identifier.media_type,
+                            title=f"{title} [{config_entry.title}]",
+                            children=[],
+                        )
+                        for title, root_identifier in (
+                            (
+                                "Clips",
+                                EventSearchIdentifier(
+                                    frigate_instance_id, FrigateMediaType.CLIPS
+                                ),
                             ),
-                            BrowseMediaSource(
-                                domain=DOMAIN,
-                                identifier=str(snapshots_identifier),
-                                media_class=MediaClass.DIRECTORY,
-                                children_media_class=snapshots_identifier.media_class,
-                                media_content_type=snapshots_identifier.media_type,
-                                title=f"Snapshots [{config_entry.title}]",
-                                can_play=False,
-                                can_expand=True,
-                                thumbnail=None,
-                                children=[],
+                            ("Recordings", RecordingIdentifier(frigate_instance_id)),
+                            (
+                                "Snapshots",
+                                EventSearchIdentifier(
+                                    frigate_instance_id, FrigateMediaType.SNAPSHOTS
+                                ),
                             ),
-                        ],
+                        )
                     )
             return base
 
@@ -669,27 +879,17 @@ class FrigateMediaSource(MediaSource):
             )
 
         if isinstance(identifier, EventSearchIdentifier):
-            if identifier.frigate_media_type == FrigateMediaType.CLIPS:
-                media_kwargs = {"has_clip": True}
-            else:
-                media_kwargs = {"has_snapshot": True}
             try:
-                events = await self._get_client(identifier).async_get_events(
-                    after=identifier.after,
-                    before=identifier.before,
-                    cameras=[identifier.camera] if identifier.camera else None,
-                    labels=[identifier.label] if identifier.label else None,
-                    sub_labels=None,
-                    zones=[identifier.zone] if identifier.zone else None,
-                    limit=10000 if identifier.name.endswith(".all") else ITEM_LIMIT,
-                    **media_kwargs,
+                # The events and the summary are independent requests, so
+                # make them concurrently.
+                events, summary_data = await asyncio.gather(
+                    self._get_events(identifier),
+                    self._get_event_summary_data(identifier),
                 )
             except FrigateApiClientError as exc:
                 raise MediaSourceError from exc
 
-            return self._browse_events(
-                await self._get_event_summary_data(identifier), identifier, events
-            )
+            return await self._browse_events(summary_data, identifier, events)
 
         if isinstance(identifier, RecordingIdentifier):
             try:
@@ -697,11 +897,10 @@ class FrigateMediaSource(MediaSource):
                     config = await self._get_client(identifier).async_get_config()
                     return self._get_camera_recording_folders(identifier, config)
 
-                info = await system_info.async_get_system_info(self.hass)
                 recording_summary = cast(
                     list[dict[str, Any]],
                     await self._get_client(identifier).async_get_recordings_summary(
-                        camera=identifier.camera, timezone=info.get("timezone", "utc")
+                        camera=identifier.camera, timezone=self.hass.config.time_zone
                     ),
                 )
 
@@ -714,35 +913,210 @@ class FrigateMediaSource(MediaSource):
 
         raise MediaSourceError(f"Invalid media source identifier: {item.identifier}")
 
+    async def _get_events(
+        self, identifier: EventSearchIdentifier
+    ) -> list[dict[str, Any]]:
+        """Get the events for an identifier.
+
+        Users tend to move back and forth between neighbouring folders, so
+        the events for a given search are reused for a short while.
+        """
+        limit = 10000 if identifier.is_all() else ITEM_LIMIT
+        key = (
+            identifier.frigate_instance_id,
+            identifier.frigate_media_type,
+            identifier.after,
+            identifier.before,
+            identifier.camera,
+            identifier.label,
+            identifier.zone,
+            limit,
+        )
+        now = time.monotonic()
+        if (cached := self._events_cache.get(key)) is not None and (
+            now - cached[0] < EVENTS_CACHE_TTL
+        ):
+            return cached[1]
+
+        if identifier.frigate_media_type == FrigateMediaType.CLIPS:
+            media_kwargs = {"has_clip": True}
+        else:
+            media_kwargs = {"has_snapshot": True}
+        events = await self._get_client(identifier).async_get_events(
+            after=identifier.after,
+            before=identifier.before,
+            cameras=[identifier.camera] if identifier.camera else None,
+            labels=[identifier.label] if identifier.label else None,
+            sub_labels=None,
+            zones=[identifier.zone] if identifier.zone else None,
+            limit=limit,
+            **media_kwargs,
+        )
+
+        # Entries are moved to the end as they are (re)fetched, so they stay in
+        # the order they were fetched in, oldest first.
+        now = time.monotonic()
+        self._events_cache.pop(key, None)
+        if len(self._events_cache) >= EVENTS_CACHE_MAX_ENTRIES:
+            self._events_cache = {
+                cached_key: value
+                for cached_key, value in self._events_cache.items()
+                if now - value[0] < EVENTS_CACHE_TTL
+            }
+            if len(self._events_cache) >= EVENTS_CACHE_MAX_ENTRIES:
+                del self._events_cache[next(iter(self._events_cache))]
+        self._events_cache[key] = (now, events)
+        return events
+
     async def _get_event_summary_data(
         self, identifier: EventSearchIdentifier
     ) -> EventSummaryData:
-        """Get event summary data."""
+        """Get event summary data.
+
+        A cached summary is returned even once it has gone stale, with a fresh
+        one fetched in the background. Only the first browse for a given
+        instance and media type, with no summary stored from a previous run,
+        waits on the API.
+        """
+        key = (identifier.frigate_instance_id, identifier.frigate_media_type)
+        if (cached := self._event_summaries.get(key)) is None:
+            # Concurrent browses without a cached summary share a single load.
+            if (lock := self._event_summary_locks.get(key)) is None:
+                lock = self._event_summary_locks[key] = asyncio.Lock()
+            async with lock:
+                if (cached := self._event_summaries.get(key)) is None:
+                    # Fall back to the summary stored from a previous run (so
+                    # treated as immediately stale), before waiting on the API.
+                    if (
+                        summary_data := await self._async_load_event_summary_data(
+                            identifier
+                        )
+                    ) is None:
+                        summary_data = await self._async_fetch_event_summary_data(
+                            identifier
+                        )
+                        self._event_summary_locks.pop(key, None)
+                        return summary_data
+                    cached = self._event_summaries[key] = (0.0, summary_data)
+            # Cached summaries are never evicted, so the lock is no longer needed.
+            self._event_summary_locks.pop(key, None)
+
+        expires_at, summary_data = cached
+        if time.monotonic() >= expires_at and key not in self._event_summary_refreshes:
+            # Not started eagerly, as a refresh that finishes immediately would
+            # clear its slot before the task is stored in it.
+            self._event_summary_refreshes[key] = self.hass.async_create_background_task(
+                self._async_refresh_event_summary_data(identifier),
+                f"Refresh Frigate event summary for {identifier}",
+                eager_start=False,
+            )
+        return summary_data
 
+    async def _async_refresh_event_summary_data(
+        self, identifier: EventSearchIdentifier
+    ) -> None:
+        """Refresh cached event summary data in the background."""
         try:
-            info = await system_info.async_get_system_info(self.hass)
+            await self._async_fetch_event_summary_data(identifier)
+        except MediaSourceError:
+            _LOGGER.debug("Could not refresh Frigate event summary", exc_info=True)
+        finally:
+            self._event_summary_refreshes.pop(
+                (identifier.frigate_instance_id, identifier.frigate_media_type), None
+            )
+
+    def _get_event_summary_storage_key(self, identifier: EventSearchIdentifier) -> str:
+        """Get the key an event summary is stored under."""
+        return f"{identifier.frigate_instance_id}/{identifier.frigate_media_type.value}"
 
+    async def _async_get_stored_event_summaries(
+        self,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get the stored event summaries, loading them on first use."""
+        if self._stored_event_summaries is None:
+            self._stored_event_summaries = await self._store.async_load() or {}
+        return self._stored_event_summaries
+
+    async def _async_load_event_summary_data(
+        self, identifier: EventSearchIdentifier
+    ) -> EventSummaryData | None:
+        """Load event summary data stored from a previous run."""
+        stored_event_summaries = await self._async_get_stored_event_summaries()
+        summary_data = stored_event_summaries.get(
+            self._get_event_summary_storage_key(identifier)
+        )
+        if summary_data is None:
+            return None
+        return await self.hass.async_add_executor_job(
+            EventSummaryData.from_raw_data, summary_data
+        )
+
+    async def _async_fetch_event_summary_data(
+        self, identifier: EventSearchIdentifier
+    ) -> EventSummaryData:
+        """Fetch event summary data from Frigate and cache it."""
+
+        try:
             if identifier.frigate_media_type == FrigateMediaType.CLIPS:
                 kwargs = {"has_clip": True}
             else:
                 kwargs = {"has_snapshot": True}
             summary_data = await self._get_client(identifier).async_get_event_summary(
-                timezone=info.get("timezone", "utc"), **kwargs
+                timezone=self.hass.config.time_zone, **kwargs
             )
         except FrigateApiClientError as exc:
             raise MediaSourceError from exc
 
-        # Add timestamps to raw data.
-        for data in summary_data:
-            data["timestamp"] = int(
-                dt.datetime.strptime(data["day"], "%Y-%m-%d")
-                .astimezone(DEFAULT_TIME_ZONE)
-                .timestamp()
-            )
+        # Processing is linear in the number of summary rows (one per day,
+        # camera, label and zone combination), so keep it off the event loop.
+        event_summary_data = await self.hass.async_add_executor_job(
+            EventSummaryData.from_raw_data, summary_data
+        )
+        self._event_summaries[
+            (identifier.frigate_instance_id, identifier.frigate_media_type)
+        ] = (
+            time.monotonic()
+            + random.uniform(
+                SUMMARY_CACHE_TTL - SUMMARY_CACHE_TTL_JITTER,
+                SUMMARY_CACHE_TTL + SUMMARY_CACHE_TTL_JITTER,
+            ),
+            event_summary_data,
+        )
 
-        return EventSummaryData.from_raw_data(summary_data)
+        await self._async_store_event_summary_data(identifier, summary_data)
+        return event_summary_data
 
-    def _browse_events(
+    async def _async_store_event_summary_data(
+        self, identifier: EventSearchIdentifier, summary_data: list[dict[str, Any]]
+    ) -> None:
+        """Store fetched event summary data, if it has changed."""
+        stored_event_summaries = await self._async_get_stored_event_summaries()
+
+        # Summaries of Frigate instances that are no longer configured are
+        # dropped, rather than kept in the store forever.
+        frigate_instance_ids = {
+            get_frigate_instance_id_for_config_entry(self.hass, config_entry)
+            for config_entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+        removed_keys = [
+            key
+            for key in stored_event_summaries
+            if key.rsplit("/", 1)[0] not in frigate_instance_ids
+        ]
+        for key in removed_keys:
+            del stored_event_summaries[key]
+
+        storage_key = self._get_event_summary_storage_key(identifier)
+        if not removed_keys and stored_event_summaries.get(storage_key) == summary_data:
+            return
+        stored_event_summaries[storage_key] = summary_data
+
+        # The data is written from the executor, so it is given a snapshot
+        # rather than the dict that keeps being updated on the event loop.
+        data = dict(stored_event_summaries)
+        self._store.async_delay_save(lambda: data, STORAGE_SAVE_DELAY)
+
+    async def _browse_events(
         self,
         summary_data: EventSummaryData,
         identifier: EventSearchIdentifier,
@@ -754,73 +1128,79 @@ class FrigateMediaSource(MediaSource):
         if identifier.is_root():
             title = f"{identifier.frigate_media_type.value.capitalize()} ({count})"
         else:
-            title = f"{' > '.join([s for s in get_friendly_name(identifier.name).split('.') if s != '']).title()} ({count})"
+            title = f"{_get_title_from_name(identifier.name)} ({count})"
 
         base = BrowseMediaSource(
-            domain=DOMAIN,
+            **BASE_DIRECTORY_KWARGS,
             identifier=str(identifier),
-            media_class=MediaClass.DIRECTORY,
             children_media_class=identifier.media_class,
             media_content_type=identifier.media_type,
             title=title,
-            can_play=False,
-            can_expand=True,
-            thumbnail=None,
             children=[],
         )
         base.children = []
 
-        event_items = self._build_event_response(identifier, events)
-
-        # if you are at the limit, but not at the root
-        if count > 0 and len(event_items) == ITEM_LIMIT and identifier.is_root():
-            # only render if > 10% is represented in view
-            if ITEM_LIMIT / float(count) > 0.1:
-                base.children.extend(event_items)
-        else:
+        # Events without a start time cannot be shown.
+        shown_events = [
+            event for event in events if event.get("start_time") is not None
+        ]
+
+        # if you are at the limit, but not at the root, only render if > 10% is
+        # represented in view (and only build the event items if they will be)
+        if not (
+            count > 0
+            and len(shown_events) == ITEM_LIMIT
+            and identifier.is_root()
+            and ITEM_LIMIT / float(count) <= 0.1
+        ):
+            if len(shown_events) > EVENT_RESPONSE_EXECUTOR_THRESHOLD:
+                # Building thousands of items (e.g. for an "all" folder) would
+                # otherwise hold up the event loop.
+                event_items = await self.hass.async_add_executor_job(
+                    self._build_event_response, identifier, shown_events
+                )
+            else:
+                event_items = self._build_event_response(identifier, shown_events)
             base.children.extend(event_items)
 
-        drilldown_sources: list[BrowseMediaSource] = []
-        drilldown_sources.extend(
-            self._build_date_sources(summary_data, identifier, len(base.children))
-        )
-        if not identifier.camera:
-            drilldown_sources.extend(
-                self._build_camera_sources(summary_data, identifier, len(base.children))
-            )
-        if not identifier.label:
-            drilldown_sources.extend(
-                self._build_label_sources(summary_data, identifier, len(base.children))
-            )
-        if not identifier.zone:
+        # only show the drill down options if there are more than 10 events
+        # and there is more than 1 drilldown or when you aren't showing any events
+        # (so don't build them at all when there are too few events)
+        if len(events) > 10:
+            drilldown_sources: list[BrowseMediaSource] = []
             drilldown_sources.extend(
-                self._build_zone_sources(summary_data, identifier, len(base.children))
+                self._build_date_sources(summary_data, identifier, len(base.children))
             )
+            for facet, values in (
+                ("camera", summary_data.cameras),
+                ("label", summary_data.labels),
+                ("zone", summary_data.zones),
+            ):
+                if not getattr(identifier, facet):
+                    drilldown_sources.extend(
+                        self._build_facet_sources(
+                            summary_data,
+                            identifier,
+                            len(base.children),
+                            facet,
+                            values,
+                        )
+                    )
 
-        # only show the drill down options if there are more than 10 events
-        # and there is more than 1 drilldown or when you aren't showing any events
-        if len(events) > 10 and (len(drilldown_sources) > 1 or len(base.children) == 0):
-            base.children.extend(drilldown_sources)
+            if len(drilldown_sources) > 1 or len(base.children) == 0:
+                base.children.extend(drilldown_sources)
 
         # add an all source if there are no drilldowns available and you are at the item limit
         if (
-            (len(base.children) == 0 or len(base.children) == len(event_items))
-            and not identifier.name.endswith(".all")
-            and len(event_items) == ITEM_LIMIT
+            (len(base.children) == 0 or len(base.children) == len(shown_events))
+            and not identifier.is_all()
+            and len(shown_events) == ITEM_LIMIT
         ):
             base.children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(identifier, name=f"{identifier.name}.all")
-                    ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
+                _get_directory_source(
+                    identifier=identifier.evolved_str(name=f"{identifier.name}.all"),
                     media_content_type=identifier.media_type,
                     title=f"All ({count})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
@@ -831,152 +1211,110 @@ class FrigateMediaSource(MediaSource):
         cls, identifier: EventSearchIdentifier, events: list[dict[str, Any]]
     ) -> list[FrigateBrowseMediaSource]:
         children: list[FrigateBrowseMediaSource] = []
+        now = dt.datetime.now(DEFAULT_TIME_ZONE).timestamp()
+
+        # These are the same for every event, so work them out just once.
+        item_kwargs = {
+            "domain": DOMAIN,
+            "media_class": identifier.media_class,
+            "media_content_type": identifier.media_type,
+            "can_play": identifier.media_type == MediaType.VIDEO,
+            "can_expand": False,
+        }
+        thumbnail_prefix = f"/api/frigate/{identifier.frigate_instance_id}/thumbnail/"
+        identifier_prefix = EventIdentifier.get_prefix(
+            identifier.frigate_instance_id, identifier.frigate_media_type
+        )
+
         for event in events:
-            start_time = event.get("start_time")
+            start_time = event["start_time"]
             end_time = event.get("end_time")
-            if start_time is None:
-                continue
-
             if end_time is None:
                 # Events that are in progress will not yet have an end_time, so
                 # the duration is shown as the current time minus the start
                 # time.
-                duration = int(
-                    dt.datetime.now(DEFAULT_TIME_ZONE).timestamp() - start_time
-                )
+                duration = int(now - start_time)
             else:
                 duration = int(end_time - start_time)
 
             children.append(
                 FrigateBrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        EventIdentifier(
-                            identifier.frigate_instance_id,
-                            frigate_media_type=identifier.frigate_media_type,
-                            camera=event["camera"],
-                            id=event["id"],
-                        )
-                    ),
-                    media_class=identifier.media_class,
-                    media_content_type=identifier.media_type,
-                    title=f"{dt.datetime.fromtimestamp(event['start_time'], DEFAULT_TIME_ZONE).strftime(DATE_STR_FORMAT)} [{duration}s, {event['label'].capitalize()} {int((event['data'].get('top_score') or event['top_score'] or 0) * 100)}%]",
-                    can_play=identifier.media_type == MediaType.VIDEO,
-                    can_expand=False,
-                    thumbnail=f"/api/frigate/{identifier.frigate_instance_id}/thumbnail/{event['id']}",
+                    **item_kwargs,
+                    # The same as str(EventIdentifier(...)), without building
+                    # and validating an identifier per event.
+                    identifier=f"{identifier_prefix}{event['camera']}/{event['id']}",
+                    title=f"{dt.datetime.fromtimestamp(start_time, DEFAULT_TIME_ZONE).strftime(DATE_STR_FORMAT)} [{duration}s, {event['label'].capitalize()} {int((event['data'].get('top_score') or event['top_score'] or 0) * 100)}%]",
+                    thumbnail=f"{thumbnail_prefix}{event['id']}",
                     frigate=FrigateBrowseMediaMetadata(event=event),
                 )
             )
         return children
 
-    def _build_camera_sources(
+    def _build_facet_sources(
         self,
         summary_data: EventSummaryData,
         identifier: EventSearchIdentifier,
         shown_event_count: int,
+        facet: str,
+        values: list[str],
     ) -> list[BrowseMediaSource]:
+        """Build camera, label or zone (the facet) media sources."""
         sources = []
-        for camera in summary_data.cameras:
-            count = self._count_by(
-                summary_data,
-                attr.evolve(
-                    identifier,
-                    camera=camera,
-                ),
-            )
+        for value in values:
+            count = self._count_by(summary_data, identifier, **{facet: value})
             if count in (0, shown_event_count):
                 continue
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.{camera}",
-                            camera=camera,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.{value}",
+                        **{facet: value},
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
-                    title=f"{get_friendly_name(camera)} ({count})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
+                    title=f"{get_friendly_name(value)} ({count})",
                 )
             )
         return sources
 
-    def _build_label_sources(
-        self,
-        summary_data: EventSummaryData,
-        identifier: EventSearchIdentifier,
-        shown_event_count: int,
-    ) -> list[BrowseMediaSource]:
-        sources = []
-        for label in summary_data.labels:
-            count = self._count_by(
-                summary_data,
-                attr.evolve(
-                    identifier,
-                    label=label,
-                ),
-            )
-            if count in (0, shown_event_count):
-                continue
-            sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.{label}",
-                            label=label,
-                        )
-                    ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
-                    media_content_type=identifier.media_type,
-                    title=f"{get_friendly_name(label)} ({count})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
-                )
-            )
-        return sources
+    def _get_day_boundaries(self, now: dt.datetime) -> tuple[int, int, int, int, int]:
+        """Get the start of today, yesterday, this month, last month and this year.
 
-    def _build_zone_sources(
-        self,
-        summary_data: EventSummaryData,
-        identifier: EventSearchIdentifier,
-        shown_event_count: int,
-    ) -> list[BrowseMediaSource]:
-        """Build zone media sources."""
-        sources = []
-        for zone in summary_data.zones:
-            count = self._count_by(summary_data, attr.evolve(identifier, zone=zone))
-            if count in (0, shown_event_count):
-                continue
-            sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.{zone}",
-                            zone=zone,
-                        )
-                    ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
-                    media_content_type=identifier.media_type,
-                    title=f"{get_friendly_name(zone)} ({count})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
-                )
-            )
-        return sources
+        The boundaries only change when the date (or time zone) does, so they
+        are cached for the day rather than recomputed on every browse.
+        """
+        key = (now.date(), now.tzinfo)
+        if self._day_boundaries is not None and self._day_boundaries[0] == key:
+            return self._day_boundaries[1]
+
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_of_today = int(today.timestamp())
+        boundaries = (
+            start_of_today,
+            start_of_today - SECONDS_IN_DAY,
+            int(today.replace(day=1).timestamp()),
+            int((today.replace(day=1) + relativedelta(months=-1)).timestamp()),
+            int(today.replace(month=1, day=1).timestamp()),
+        )
+        self._day_boundaries = (key, boundaries)
+        return boundaries
+
+    def _get_date_boundaries(
+        self, after: int, before: int, step: relativedelta
+    ) -> tuple[list[dt.datetime], list[int]]:
+        """Get the local dates, and their timestamps, that split a date range.
+
+        The range is walked from its start a step at a time, with each point
+        before the end of the range starting a bucket at its local midnight.
+        The final date/timestamp is the end of the last bucket.
+        """
+        start = dt.datetime.fromtimestamp(after, DEFAULT_TIME_ZONE)
+        current = start
+        dates = []
+        while current.timestamp() < before:
+            dates.append(current.replace(hour=0, minute=0, second=0, microsecond=0))
+            current = start + step * len(dates)
+        dates.append(current.replace(hour=0, minute=0, second=0, microsecond=0))
+        return dates, [int(date.timestamp()) for date in dates]
 
     def _build_date_sources(
         self,
@@ -988,50 +1326,6 @@ class FrigateMediaSource(MediaSource):
         sources = []
 
         now = dt.datetime.now(DEFAULT_TIME_ZONE)
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        start_of_today = int(today.timestamp())
-        start_of_yesterday = start_of_today - SECONDS_IN_DAY
-        start_of_month = int(today.replace(day=1).timestamp())
-        start_of_last_month = int(
-            (today.replace(day=1) + relativedelta(months=-1)).timestamp()
-        )
-        start_of_year = int(today.replace(month=1, day=1).timestamp())
-
-        count_today = self._count_by(
-            summary_data, attr.evolve(identifier, after=start_of_today)
-        )
-
-        count_yesterday = self._count_by(
-            summary_data,
-            attr.evolve(
-                identifier,
-                after=start_of_yesterday,
-                before=start_of_today,
-            ),
-        )
-        count_this_month = self._count_by(
-            summary_data,
-            attr.evolve(
-                identifier,
-                after=start_of_month,
-            ),
-        )
-        count_last_month = self._count_by(
-            summary_data,
-            attr.evolve(
-                identifier,
-                after=start_of_last_month,
-                before=start_of_month,
-            ),
-        )
-        count_this_year = self._count_by(
-            summary_data,
-            attr.evolve(
-                identifier,
-                after=start_of_year,
-            ),
-        )
 
         # if a date range has already been selected
         if identifier.before or identifier.after:
@@ -1040,133 +1334,150 @@ class FrigateMediaSource(MediaSource):
 
             # if we are looking at years, split into months
             if before - after > SECONDS_IN_MONTH:
-                current = after
-                while current < before:
-                    current_date = (
-                        dt.datetime.fromtimestamp(current)
-                        .astimezone(DEFAULT_TIME_ZONE)
-                        .replace(hour=0, minute=0, second=0, microsecond=0)
-                    )
-                    start_of_current_month = int(current_date.timestamp())
-                    start_of_next_month = int(
-                        (current_date + relativedelta(months=+1)).timestamp()
-                    )
-                    count_current = self._count_by(
-                        summary_data,
-                        attr.evolve(
-                            identifier,
-                            after=start_of_current_month,
-                            before=start_of_next_month,
-                        ),
-                    )
+                dates, timestamps = self._get_date_boundaries(
+                    after, before, relativedelta(months=+1)
+                )
+                # Look up the events before every boundary at once, rather than
+                # counting each month separately.
+                counts_before = summary_data.count_before(
+                    timestamps,
+                    camera=identifier.camera,
+                    label=identifier.label,
+                    zone=identifier.zone,
+                )
+                for (
+                    current_date,
+                    start_of_current_month,
+                    start_of_next_month,
+                    count_before_current,
+                    count_before_next,
+                ) in zip(
+                    dates,
+                    timestamps,
+                    timestamps[1:],
+                    counts_before,
+                    counts_before[1:],
+                ):
+                    count_current = count_before_next - count_before_current
                     sources.append(
-                        BrowseMediaSource(
-                            domain=DOMAIN,
-                            identifier=str(
-                                attr.evolve(
-                                    identifier,
-                                    name=f"{identifier.name}.{current_date.strftime('%Y-%m')}",
-                                    after=start_of_current_month,
-                                    before=start_of_next_month,
-                                )
+                        _get_directory_source(
+                            identifier=identifier.evolved_str(
+                                name=f"{identifier.name}.{current_date.strftime('%Y-%m')}",
+                                after=start_of_current_month,
+                                before=start_of_next_month,
                             ),
-                            media_class=MediaClass.DIRECTORY,
-                            children_media_class=MediaClass.DIRECTORY,
                             media_content_type=identifier.media_type,
                             title=f"{current_date.strftime('%B')} ({count_current})",
-                            can_play=False,
-                            can_expand=True,
-                            thumbnail=None,
                         )
                     )
-                    current = current + SECONDS_IN_MONTH
                 return sources
 
             # if we are looking at a month, split into days
             if before - after > SECONDS_IN_DAY:
-                current = after
-                while current < before:
-                    current_date = (
-                        dt.datetime.fromtimestamp(current)
-                        .astimezone(DEFAULT_TIME_ZONE)
-                        .replace(hour=0, minute=0, second=0, microsecond=0)
-                    )
-                    start_of_current_day = int(current_date.timestamp())
-                    start_of_next_day = start_of_current_day + SECONDS_IN_DAY
-                    count_current = self._count_by(
-                        summary_data,
-                        attr.evolve(
-                            identifier,
-                            after=start_of_current_day,
-                            before=start_of_next_day,
-                        ),
-                    )
+                # Only days that have events are shown, so walk those rather
+                # than every day in the range.
+                dates, timestamps = self._get_date_boundaries(
+                    after, before, relativedelta(days=+1)
+                )
+                # Summary days start at local midnight, like the boundaries, so
+                # the date and end of each day can be looked up rather than
+                # converted again.
+                days = {
+                    start: (date, end)
+                    for date, start, end in zip(dates, timestamps, timestamps[1:])
+                }
+                for start_of_current_day, count_current in summary_data.count_by_day(
+                    timestamps[0],
+                    timestamps[-1],
+                    camera=identifier.camera,
+                    label=identifier.label,
+                    zone=identifier.zone,
+                ):
+                    if (day := days.get(start_of_current_day)) is not None:
+                        current_date, start_of_next_day = day
+                    else:
+                        # The (cached) summary was indexed before a time zone
+                        # change.
+                        current_date = dt.datetime.fromtimestamp(
+                            start_of_current_day, DEFAULT_TIME_ZONE
+                        )
+                        start_of_next_day = int(
+                            (current_date + relativedelta(days=+1)).timestamp()
+                        )
                     if count_current > 0:
                         sources.append(
-                            BrowseMediaSource(
-                                domain=DOMAIN,
-                                identifier=str(
-                                    attr.evolve(
-                                        identifier,
-                                        name=f"{identifier.name}.{current_date.strftime('%Y-%m-%d')}",
-                                        after=start_of_current_day,
-                                        before=start_of_next_day,
-                                    )
+                            _get_directory_source(
+                                identifier=identifier.evolved_str(
+                                    name=f"{identifier.name}.{current_date.strftime('%Y-%m-%d')}",
+                                    after=start_of_current_day,
+                                    before=start_of_next_day,
                                 ),
-                                media_class=MediaClass.DIRECTORY,
-                                children_media_class=MediaClass.DIRECTORY,
                                 media_content_type=identifier.media_type,
                                 title=f"{current_date.strftime('%B %d')} ({count_current})",
-                                can_play=False,
-                                can_expand=True,
-                                thumbnail=None,
                             )
                         )
-                    current = current + SECONDS_IN_DAY
                 return sources
 
             return sources
 
+        (
+            start_of_today,
+            start_of_yesterday,
+            start_of_month,
+            start_of_last_month,
+            start_of_year,
+        ) = self._get_day_boundaries(now)
+
+        # All the counts below come from the number of events before each
+        # boundary, so look those up together.
+        (
+            before_today,
+            before_yesterday,
+            before_month,
+            before_last_month,
+            before_year,
+            total,
+        ) = summary_data.count_before(
+            [
+                start_of_today,
+                start_of_yesterday,
+                start_of_month,
+                start_of_last_month,
+                start_of_year,
+                None,
+            ],
+            camera=identifier.camera,
+            label=identifier.label,
+            zone=identifier.zone,
+        )
+        count_today = total - before_today
+        count_yesterday = before_today - before_yesterday
+        count_this_month = total - before_month
+        count_last_month = before_month - before_last_month
+        count_this_year = total - before_year
+
         if count_today > shown_event_count:
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.today",
-                            after=start_of_today,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.today",
+                        after=start_of_today,
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title=f"Today ({count_today})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
         if count_yesterday > shown_event_count:
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.yesterday",
-                            after=start_of_yesterday,
-                            before=start_of_today,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.yesterday",
+                        after=start_of_yesterday,
+                        before=start_of_today,
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title=f"Yesterday ({count_yesterday})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
@@ -1175,44 +1486,26 @@ class FrigateMediaSource(MediaSource):
             and count_this_month > shown_event_count
         ):
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.this_month",
-                            after=start_of_month,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.this_month",
+                        after=start_of_month,
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title=f"This Month ({count_this_month})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
         if count_last_month > shown_event_count:
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.last_month",
-                            after=start_of_last_month,
-                            before=start_of_month,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.last_month",
+                        after=start_of_last_month,
+                        before=start_of_month,
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title=f"Last Month ({count_last_month})",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
@@ -1221,55 +1514,49 @@ class FrigateMediaSource(MediaSource):
             and count_this_year > shown_event_count
         ):
             sources.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            name=f"{identifier.name}.this_year",
-                            after=start_of_year,
-                        )
+                _get_directory_source(
+                    identifier=identifier.evolved_str(
+                        name=f"{identifier.name}.this_year",
+                        after=start_of_year,
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title="This Year",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
         return sources
 
     def _count_by(
-        self, summary_data: EventSummaryData, identifier: EventSearchIdentifier
+        self,
+        summary_data: EventSummaryData,
+        identifier: EventSearchIdentifier,
+        **filters: Any,
     ) -> int:
-        """Return count of events that match the identifier."""
-        return sum(
-            d["count"]
-            for d in summary_data.data
-            if (identifier.after is None or d["timestamp"] >= identifier.after)
-            and (identifier.before is None or d["timestamp"] < identifier.before)
-            and (identifier.camera is None or identifier.camera in d["camera"])
-            and (identifier.label is None or identifier.label in d["label"])
-            and (identifier.zone is None or identifier.zone in d["zones"])
+        """Return count of events that match the identifier.
+
+        Any of the after, before, camera, label or zone filters may be passed
+        to override those of the identifier, without having to evolve a new
+        identifier just to count.
+        """
+        return summary_data.count(
+            **{
+                "after": identifier.after,
+                "before": identifier.before,
+                "camera": identifier.camera,
+                "label": identifier.label,
+                "zone": identifier.zone,
+                **filters,
+            }
         )
 
     def _get_recording_base_media_source(
         self, identifier: RecordingIdentifier
     ) -> BrowseMediaSource:
         """Get the base BrowseMediaSource object for a recording identifier."""
-        return BrowseMediaSource(
-            domain=DOMAIN,
+        return _get_directory_source(
             identifier=str(identifier),
-            media_class=MediaClass.DIRECTORY,
-            children_media_class=MediaClass.DIRECTORY,
             media_content_type=identifier.media_type,
             title="Recordings",
-            can_play=False,
-            can_expand=True,
-            thumbnail=None,
             children=[],
         )
 
@@ -1282,21 +1569,15 @@ class FrigateMediaSource(MediaSource):
 
         for camera in config["cameras"].keys():
             base.children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
+                _get_directory_source(
                     identifier=str(
                         attr.evolve(
                             identifier,
                             camera=camera,
                         )
                     ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
                     media_content_type=identifier.media_type,
                     title=get_friendly_name(camera),
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
@@ -1310,29 +1591,19 @@ class FrigateMediaSource(MediaSource):
         base.children = []
 
         for day_item in recording_days:
+            # The identifier validates the day itself.
             try:
-                dt.datetime.strptime(day_item["day"], "%Y-%m-%d")
+                day_identifier = attr.evolve(identifier, year_month_day=day_item["day"])
             except ValueError as exc:
                 raise MediaSourceError(
                     f"Media source is not valid for {identifier} {day_item['day']}"
                 ) from exc
 
             base.children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=str(
-                        attr.evolve(
-                            identifier,
-                            year_month_day=day_item["day"],
-                        )
-                    ),
-                    media_class=MediaClass.DIRECTORY,
-                    children_media_class=MediaClass.DIRECTORY,
+                _get_directory_source(
+                    identifier=str(day_identifier),
                     media_content_type=identifier.media_type,
                     title=day_item["day"],
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
                 )
             )
 
@@ -1355,12 +1626,12 @@ class FrigateMediaSource(MediaSource):
         )
 
         for hour_data in hour_items:
-            try:
-                title = dt.datetime.strptime(hour_data["hour"], "%H").strftime("%H:00")
-            except ValueError as exc:
+            hour = hour_data["hour"]
+            if not (len(hour) <= 2 and hour.isdecimal() and int(hour) <= 23):
                 raise MediaSourceError(
-                    f"Media source is not valid for {identifier} {hour_data['hour']}"
-                ) from exc
+                    f"Media source is not valid for {identifier} {hour}"
+                )
+            title = f"{int(hour):02}:00"
 
             base.children.append(
                 BrowseMediaSource(
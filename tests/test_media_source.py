@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 import copy
 import datetime
@@ -10,6 +11,7 @@ import logging
 import os
 from typing import Any, cast
 from unittest.mock import AsyncMock, Mock, call, patch
+import zoneinfo
 
 import pytest
 
@@ -23,6 +25,7 @@ from custom_components.frigate.const import (
 from custom_components.frigate.media_source import (
     EventIdentifier,
     EventSearchIdentifier,
+    EventSummaryData,
     FrigateMediaSource,
     FrigateMediaType,
     Identifier,
@@ -32,14 +35,14 @@ from custom_components.frigate.media_source import (
 from homeassistant.components import media_source
 from homeassistant.components.media_source import const
 from homeassistant.components.media_source.error import MediaSourceError, Unresolvable
-from homeassistant.components.media_source.models import PlayMedia
-from homeassistant.const import CONF_URL
+from homeassistant.components.media_source.models import BrowseMediaSource, PlayMedia
+from homeassistant.const import CONF_URL, EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import system_info
 from homeassistant.util.dt import DEFAULT_TIME_ZONE, async_get_time_zone
 
 from . import (
     TEST_CONFIG,
+    TEST_EVENT_SUMMARY,
     TEST_FRIGATE_INSTANCE_ID,
     TEST_URL,
     create_mock_frigate_client,
@@ -615,7 +618,7 @@ async def test_async_browse_media_clip_search_multi_month_drilldown(
         **DRILLDOWN_BASE,
         "media_content_id": (
             f"media-source://frigate/{TEST_FRIGATE_INSTANCE_ID}"
-            "/event-search/clips/Title.2021-03/1614816000/1617494400///"
+            "/event-search/clips/Title.2021-03/1614556800/1617235200///"
         ),
         "title": "March (0)",
     } in media.as_dict()["children"]
@@ -650,10 +653,9 @@ async def test_async_resolve_media(
     )
 
     # Convert from HA local timezone to UTC.
-    info = await system_info.async_get_system_info(hass)
     date = datetime.datetime(2021, 5, 30, 15, 46, 8, 0, datetime.timezone.utc) - (
         datetime.datetime.now(
-            await async_get_time_zone(info.get("timezone", "utc"))
+            await async_get_time_zone(hass.config.time_zone)
         ).utcoffset()
         or datetime.timedelta()
     )
@@ -689,10 +691,7 @@ async def test_async_resolve_media(
         )
 
     # Test resolving when system timezone is not found.
-    with patch(
-        "homeassistant.helpers.system_info.async_get_system_info",
-        return_value={"timezone": "UNKNOWN"},
-    ):
+    with patch.object(hass.config, "time_zone", "UNKNOWN"):
         with pytest.raises(Unresolvable):
             media = await media_source.async_resolve_media(
                 hass,
@@ -986,6 +985,10 @@ async def test_identifier() -> None:
     with pytest.raises(NotImplementedError):
         identifier.media_class
 
+    # Base identifiers do not have a string form.
+    with pytest.raises(NotImplementedError):
+        str(identifier)
+
 
 async def test_event_search_identifier() -> None:
     """Test event search identifier."""
@@ -1008,6 +1011,19 @@ async def test_event_search_identifier() -> None:
     assert identifier.zone == "zone"
     assert str(identifier) == identifier_in
     assert not identifier.is_root()
+    assert not identifier.is_all()
+    assert EventSearchIdentifier(
+        TEST_FRIGATE_INSTANCE_ID, FrigateMediaType.CLIPS, name=".front_door.all"
+    ).is_all()
+
+    assert identifier.evolved_str(after=None, camera="back_door", zone=None) == (
+        f"{TEST_FRIGATE_INSTANCE_ID}/event-search"
+        "/clips/.this_month.2021-06-04.front_door.person"
+        "//1622851200/back_door/person/"
+    )
+
+    # Repeated parses of the same string return the same (immutable) instance.
+    assert Identifier.from_str(identifier_in) is identifier
 
     # Event searches have no equivalent Frigate server path (searches result in
     # EventIdentifiers, that do have a Frigate server path).
@@ -1032,6 +1048,20 @@ async def test_event_search_identifier() -> None:
         is None
     )
 
+    # No media type.
+    assert (
+        EventSearchIdentifier.from_str(f"{TEST_FRIGATE_INSTANCE_ID}/event-search")
+        is None
+    )
+
+    # Not an event search identifier.
+    assert (
+        EventSearchIdentifier.from_str(
+            f"{TEST_FRIGATE_INSTANCE_ID}/event/clips/camera/something"
+        )
+        is None
+    )
+
     assert EventSearchIdentifier(
         TEST_FRIGATE_INSTANCE_ID, FrigateMediaType.CLIPS
     ).is_root()
@@ -1083,6 +1113,15 @@ async def test_recordings_identifier() -> None:
         is None
     )
 
+    # Not a 4 digit year, or a 1-2 digit month and day.
+    for year_month_day in ("21-05-03", "2021-005-03", "2021-05-003", "2021--03"):
+        assert (
+            Identifier.from_str(
+                f"{TEST_FRIGATE_INSTANCE_ID}/recordings/cam/{year_month_day}"
+            )
+            is None
+        )
+
     # No 25th hour.
     assert (
         RecordingIdentifier.from_str(
@@ -1127,6 +1166,14 @@ async def test_event_identifier() -> None:
     assert identifier.camera == "camera"
     assert identifier.id == "something"
     assert identifier.mime_type == "application/x-mpegURL"
+    assert str(identifier) == identifier_in
+
+    # Event items in a listing build their identifiers from the shared prefix.
+    assert (
+        EventIdentifier.get_prefix(TEST_FRIGATE_INSTANCE_ID, FrigateMediaType.CLIPS)
+        + "camera/something"
+        == identifier_in
+    )
 
     assert not Identifier.from_str(f"{TEST_FRIGATE_INSTANCE_ID}/event/clips/something")
 
@@ -1314,6 +1361,56 @@ async def test_media_types() -> None:
     assert clips.extension == "m3u8"
 
 
+async def test_event_summary_data() -> None:
+    """Test EventSummaryData counts."""
+    rows = copy.deepcopy(TEST_EVENT_SUMMARY)
+    summary_data = EventSummaryData.from_raw_data(rows)
+    # The rows (that may also be stored) are left unchanged.
+    assert rows == TEST_EVENT_SUMMARY
+    assert all("timestamp" not in row for row in summary_data.data)
+    yesterday = int(datetime.datetime(2021, 6, 3, tzinfo=DEFAULT_TIME_ZONE).timestamp())
+
+    assert summary_data.count_by_day(
+        yesterday, yesterday + 86400, camera="front_door", label="person"
+    ) == [(yesterday, 53)]
+    assert summary_data.count_by_day(yesterday, yesterday + 86400, camera="back") == []
+    assert summary_data.count_before([yesterday, None], camera="back") == [0, 0]
+
+
+async def test_event_summary_time_zone_change(hass: HomeAssistant) -> None:
+    """Verify days are shown for a summary indexed before a time zone change."""
+    source = cast(FrigateMediaSource, await async_get_media_source(hass))
+    with patch(
+        "custom_components.frigate.media_source.DEFAULT_TIME_ZONE",
+        zoneinfo.ZoneInfo("Asia/Tokyo"),
+    ):
+        summary_data = EventSummaryData.from_raw_data(copy.deepcopy(TEST_EVENT_SUMMARY))
+
+    identifier = EventSearchIdentifier(
+        TEST_FRIGATE_INSTANCE_ID,
+        FrigateMediaType.CLIPS,
+        name=".june",
+        after=int(datetime.datetime(2021, 6, 1, tzinfo=datetime.UTC).timestamp()),
+        before=int(datetime.datetime(2021, 7, 1, tzinfo=datetime.UTC).timestamp()),
+    )
+    with patch(
+        "custom_components.frigate.media_source.DEFAULT_TIME_ZONE", datetime.UTC
+    ):
+        # pylint: disable=protected-access
+        sources = source._build_date_sources(summary_data, identifier, 0)
+
+    # Tokyo midnights fall in the afternoon of the previous day in UTC.
+    assert [item.title for item in sources] == [
+        "June 01 (54)",
+        "June 02 (53)",
+        "June 03 (103)",
+    ]
+    assert sources[0].identifier == (
+        f"{TEST_FRIGATE_INSTANCE_ID}/event-search/clips/.june.2021-06-01"
+        "/1622559600/1622646000///"
+    )
+
+
 async def test_in_progress_event(hass: HomeAssistant) -> None:
     """Verify in progress events are handled correctly."""
     client = create_mock_frigate_client()
@@ -1437,3 +1534,214 @@ async def test_bad_event(hass: HomeAssistant) -> None:
     )
 
     assert len(media.as_dict()["children"]) == 0
+
+
+async def test_event_summary_cache(
+    frigate_client: AsyncMock, hass: HomeAssistant
+) -> None:
+    """Verify the event summary is cached and refreshed in the background."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+    identifier = (
+        f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}/event-search/clips"
+    )
+
+    # Cache the summary such that it is immediately stale.
+    with patch(
+        "custom_components.frigate.media_source.random.uniform", return_value=-1
+    ):
+        await media_source.async_browse_media(hass, identifier)
+    assert frigate_client.async_get_event_summary.call_count == 1
+
+    # The stale summary is still served, with a refresh scheduled alongside.
+    frigate_client.async_get_event_summary = AsyncMock(return_value=[])
+    media = await media_source.async_browse_media(hass, identifier)
+    assert media.as_dict()["title"] == "Clips (321)"
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert frigate_client.async_get_event_summary.call_count == 1
+
+    # The refreshed summary is then served from the cache.
+    for _ in range(2):
+        media = await media_source.async_browse_media(hass, identifier)
+        assert media.as_dict()["title"] == "Clips (0)"
+    assert frigate_client.async_get_event_summary.call_count == 1
+
+
+async def test_event_summary_concurrent_load(
+    frigate_client: AsyncMock, hass: HomeAssistant
+) -> None:
+    """Verify concurrent browses share a single event summary load."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+    identifier = (
+        f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}/event-search/clips"
+    )
+
+    results = await asyncio.gather(
+        *(media_source.async_browse_media(hass, identifier) for _ in range(3))
+    )
+    assert [media.as_dict()["title"] for media in results] == ["Clips (321)"] * 3
+    assert frigate_client.async_get_event_summary.call_count == 1
+
+    # The load's lock is dropped once the summary is cached.
+    source = cast(FrigateMediaSource, hass.data[media_source.DOMAIN][DOMAIN])
+    # pylint: disable=protected-access
+    assert source._event_summary_locks == {}
+
+
+async def test_event_summary_refresh_error(
+    frigate_client: AsyncMock, hass: HomeAssistant
+) -> None:
+    """Verify a failed background refresh keeps serving the stale summary."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+    identifier = (
+        f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}/event-search/clips"
+    )
+
+    # Cache the summary such that it is immediately stale.
+    with patch(
+        "custom_components.frigate.media_source.random.uniform", return_value=-1
+    ):
+        await media_source.async_browse_media(hass, identifier)
+
+    frigate_client.async_get_event_summary = AsyncMock(
+        side_effect=FrigateApiClientError
+    )
+    for call_count in range(1, 3):
+        media = await media_source.async_browse_media(hass, identifier)
+        assert media.as_dict()["title"] == "Clips (321)"
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        # The failed refresh no longer counts as in progress, so the next
+        # browse tries again.
+        assert frigate_client.async_get_event_summary.call_count == call_count
+
+
+async def test_event_summary_storage(
+    frigate_client: AsyncMock, hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Verify event summaries are stored, and used after a restart."""
+    hass_storage["frigate.event_summaries"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "frigate.event_summaries",
+        "data": {
+            f"{TEST_FRIGATE_INSTANCE_ID}/clips": copy.deepcopy(TEST_EVENT_SUMMARY),
+            "NOT_A_REAL_FRIGATE_INSTANCE_ID/clips": [],
+        },
+    }
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+
+    async def browse(media_type: str) -> BrowseMediaSource:
+        # Summaries are cached such that they are immediately stale.
+        with patch(
+            "custom_components.frigate.media_source.random.uniform", return_value=-1
+        ):
+            media = await media_source.async_browse_media(
+                hass,
+                f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}"
+                f"/event-search/{media_type}",
+            )
+            await hass.async_block_till_done(wait_background_tasks=True)
+        return media
+
+    async def write() -> dict[str, Any] | None:
+        # Writes are delayed, at the latest until Home Assistant stops.
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        return cast(
+            dict[str, Any] | None,
+            hass_storage.pop("frigate.event_summaries", {}).get("data"),
+        )
+
+    # The stored summary is served without waiting on the API, which is then
+    # called in the background. Summaries of instances that are no longer
+    # configured are dropped from the store.
+    media = await browse("clips")
+    assert media.as_dict()["title"] == "Clips (321)"
+    assert frigate_client.async_get_event_summary.call_count == 1
+    assert await write() == {f"{TEST_FRIGATE_INSTANCE_ID}/clips": TEST_EVENT_SUMMARY}
+
+    # Summaries fetched from the API are stored too.
+    frigate_client.async_get_event_summary = AsyncMock(return_value=[])
+    await browse("snapshots")
+    assert await write() == {
+        f"{TEST_FRIGATE_INSTANCE_ID}/clips": TEST_EVENT_SUMMARY,
+        f"{TEST_FRIGATE_INSTANCE_ID}/snapshots": [],
+    }
+
+    # Unchanged summaries are not written again.
+    await browse("snapshots")
+    assert frigate_client.async_get_event_summary.call_count == 2
+    assert await write() is None
+
+
+async def test_events_cache(frigate_client: AsyncMock, hass: HomeAssistant) -> None:
+    """Verify events are briefly reused for the same search."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+
+    for _ in range(2):
+        for name in ("", ".breadcrumb"):
+            await media_source.async_browse_media(
+                hass,
+                f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}"
+                f"/event-search/clips/{name}/1622505600////",
+            )
+    assert frigate_client.async_get_events.call_count == 1
+
+    await media_source.async_browse_media(
+        hass,
+        f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}"
+        "/event-search/clips/.all/1622505600////",
+    )
+    assert frigate_client.async_get_events.call_count == 2
+
+
+async def test_event_items_built_in_executor(
+    frigate_client: AsyncMock, hass: HomeAssistant
+) -> None:
+    """Verify the items for many events are built the same in the executor."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+    identifier = (
+        f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}"
+        "/event-search/clips/.front_door/////"
+    )
+
+    with patch("custom_components.frigate.media_source.dt.datetime", new=TODAY):
+        media = await media_source.async_browse_media(hass, identifier)
+        with patch(
+            "custom_components.frigate.media_source.EVENT_RESPONSE_EXECUTOR_THRESHOLD",
+            10,
+        ):
+            executor_media = await media_source.async_browse_media(hass, identifier)
+
+    assert executor_media.as_dict() == media.as_dict()
+    assert [
+        child["media_class"] for child in executor_media.as_dict()["children"]
+    ].count("video") == 50
+
+
+async def test_events_cache_max_entries(
+    frigate_client: AsyncMock, hass: HomeAssistant
+) -> None:
+    """Verify the oldest events are dropped once the cache is full."""
+    await setup_mock_frigate_config_entry(hass, client=frigate_client)
+
+    async def browse(after: int) -> None:
+        await media_source.async_browse_media(
+            hass,
+            f"{const.URI_SCHEME}{DOMAIN}/{TEST_FRIGATE_INSTANCE_ID}"
+            f"/event-search/clips//{after}////",
+        )
+
+    with patch("custom_components.frigate.media_source.EVENTS_CACHE_MAX_ENTRIES", 2):
+        for after in (1622505600, 1622592000, 1622678400):
+            await browse(after)
+        assert frigate_client.async_get_events.call_count == 3
+
+        # The first search was dropped, and then replaces the second.
+        await browse(1622505600)
+        assert frigate_client.async_get_events.call_count == 4
+        for after in (1622678400, 1622505600):
+            await browse(after)
+        assert frigate_client.async_get_events.call_count == 4
+        await browse(1622592000)
+        assert frigate_client.async_get_events.call_count == 5